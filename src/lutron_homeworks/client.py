@@ -1,8 +1,10 @@
 import asyncio
 import errno
+import functools
+import inspect
 import logging
+import socket
 from opentelemetry import trace
-import re
 from typing import TYPE_CHECKING, Any, List, Type
 
 from .utils.events import CallbackT, EventBus, EventT, SubscriptionToken
@@ -13,13 +15,93 @@ from .commands import LutronCommand
 tracer = trace.get_tracer(__name__)
 logger = logging.getLogger(__name__)
 
-RE_IS_INTEGER = re.compile(r"^\-?\d+$")
-RE_IS_FLOAT = re.compile(r"^\-?\d+\.\d+$")
+def _tracing_active() -> bool:
+    """True when a real tracer provider is configured."""
+    provider = trace.get_tracer_provider()
+    return not isinstance(provider, trace.ProxyTracerProvider)
+
+def _traced(name: str):
+    """Like tracer.start_as_current_span, but skips span creation entirely
+    when no tracer provider is configured."""
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not _tracing_active():
+                    return await fn(*args, **kwargs)
+                with tracer.start_as_current_span(name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _tracing_active():
+                return fn(*args, **kwargs)
+            with tracer.start_as_current_span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# Pre-encoded protocol constants for the hot read/write paths
+_PROMPT_BYTES = PROMPT.encode('ascii')
+_LINE_END_BYTES = LINE_END.encode('ascii')
+_COMMAND_RESPONSE_PREFIX_BYTES = COMMAND_RESPONSE_PREFIX.encode('ascii')
+# First-byte discriminators for the line classifier in _parse_output
+_PROMPT_FIRST_BYTE = _PROMPT_BYTES[0]
+_RESPONSE_FIRST_BYTE = _COMMAND_RESPONSE_PREFIX_BYTES[0]
+_LOGIN_PROMPT = b"login: "
+_PASSWORD_PROMPT = b"password: "
+
+# Cap on lines processed per wakeup so a burst can't starve other tasks
+_MAX_BURST_LINES = 1024
 
 if TYPE_CHECKING:
     from lutron_homeworks.commands import LutronCommand
 
+def _coerce(part: str) -> Any:
+    """Convert a response token to int or float when it looks numeric."""
+    digits = part[1:] if part.startswith('-') else part
+    if digits.isdigit():
+        return int(part)
+    if '.' in digits:
+        whole, _, fraction = digits.partition('.')
+        if whole.isdigit() and fraction.isdigit():
+            return float(part)
+    return part
+
 class LutronHomeworksClient:
+    __slots__ = (
+        'host',
+        'port',
+        'username',
+        'password',
+        'keepalive_interval',
+        '_username_bytes',
+        '_password_bytes',
+        '_reader',
+        '_writer',
+        'connected',
+        'command_ready',
+        '_tasks',
+        '_tx_queue',
+        '_login_timeout',
+        '_write_timeout',
+        '_idle_read_timeout',
+        '_reconnect_params',
+        '_read_buffer',
+        '_read_line',
+        '_read_prompt',
+        '_ev_all',
+        '_ev_nonresp',
+        '_ev_prompt',
+        '_eventbus',
+        '_lock',
+        '_command_lock',
+        '_stop_event',
+        '_disconnected_event',
+        '_heartbeat_sent_event',
+    )
+
     def __init__(
         self,
         host: str,
@@ -34,13 +116,23 @@ class LutronHomeworksClient:
         self.password = password
         self.keepalive_interval = keepalive_interval
 
+        # Pre-encode the login credentials once, line ending included
+        self._username_bytes = (username + LINE_END).encode('ascii') if username is not None else None
+        self._password_bytes = (password + LINE_END).encode('ascii') if password is not None else None
+
         self._reader = None
         self._writer = None
         self.connected = False
         self.command_ready = False
-        self._keepalive_task = None
-        self._output_emitter_task = None
-        self._reconnect_task = None
+        # Background task slots, keyed by role
+        self._tasks: dict[str, asyncio.Task | None] = {
+            'keepalive': None,
+            'output_emitter': None,
+            'tx_writer': None,
+            'reconnect': None,
+            'reset': None,
+        }
+        self._tx_queue: asyncio.Queue | None = None
 
         self._login_timeout = 5
         self._write_timeout = 2
@@ -52,6 +144,17 @@ class LutronHomeworksClient:
             'max_delay': 60,
         }
 
+        self._read_buffer = bytearray()
+
+        # Terminator-bound readers; partials avoid a wrapper frame per call
+        self._read_line = functools.partial(self._read_until, _LINE_END_BYTES)
+        self._read_prompt = functools.partial(self._read_until, _PROMPT_BYTES)
+
+        # Cache the special event names used on every received line
+        self._ev_all = LutronSpecialEvents.AllEvents.value
+        self._ev_nonresp = LutronSpecialEvents.NonResponseEvents.value
+        self._ev_prompt = LutronSpecialEvents.CommandPrompt.value
+
         self._eventbus = EventBus()
         self._lock = asyncio.Lock()
         self._command_lock = asyncio.Lock()
@@ -77,7 +180,7 @@ class LutronHomeworksClient:
         self._write_timeout = timeout
         return self
     
-    @tracer.start_as_current_span("Connect")
+    @_traced("Connect")
     async def connect(self) -> bool:
         if self._stop_event.is_set():
             raise RuntimeError("Client is closed, reconnect not permitted.")
@@ -86,7 +189,13 @@ class LutronHomeworksClient:
         logger.info(f"Connecting to {self.host}:{self.port}")
         try:
             async with self._lock:
-                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+                # Explicit stream buffer limit (matches the 64 KiB default);
+                # terminator handling itself lives in _read_until
+                self._reader, self._writer = await asyncio.open_connection(
+                    self.host, self.port, limit=2**16
+                )
+                self._read_buffer.clear()
+                self._configure_socket()
                 self.connected = True
 
             login_successful = await self._login()
@@ -101,6 +210,7 @@ class LutronHomeworksClient:
             # Start tasks related to successful connection
             self._start_keepalive()
             self._start_output_emitter()
+            self._start_tx_writer()
         except Exception as e:
             # TODO: handle ENETUNREACH OSError more gracefully
             logger.error(f"Connection failed: {e}")
@@ -108,7 +218,31 @@ class LutronHomeworksClient:
         
         return self.connected
 
-    @tracer.start_as_current_span("Login")
+    def _configure_socket(self) -> None:
+        """Tune the underlying socket for the interactive command protocol."""
+        # Hand writes to the socket immediately; drain() then only returns
+        # once the outbound buffer is actually empty
+        self.writer.transport.set_write_buffer_limits(0)
+
+        sock = self.writer.get_extra_info('socket')
+        if sock is None:
+            return
+
+        try:
+            # Disable Nagle so small commands and heartbeats are sent
+            # immediately instead of being batched in the kernel
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logger.warning(f"Failed to set TCP_NODELAY: {e}")
+
+        try:
+            # Room for monitor bursts (e.g. after a scene command) so the
+            # kernel never pushes back while the emitter drains
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        except OSError as e:
+            logger.warning(f"Failed to set SO_RCVBUF: {e}")
+
+    @_traced("Login")
     async def _login(self) -> bool:
         try:
             # Use wait_for to add timeout to login operation
@@ -123,39 +257,35 @@ class LutronHomeworksClient:
 
     async def _process_login(self) -> bool:
         try:
-            if self.username is None or self.password is None:
+            if self._username_bytes is None or self._password_bytes is None:
                 raise ValueError("Username and password must be provided.")
 
             logger.debug("Waiting for login prompt...")
-            with tracer.start_as_current_span("Find Login Prompt"):
-                await self._read_until(b"login: ")
-                logger.debug("Sending Username")
-                await self._write(self.username + LINE_END)
-
-            with tracer.start_as_current_span("Find Password Prompt"):
-                await self._read_until(b"password: ")
-                logger.debug("Sending Password")
-                await self._write(self.password + LINE_END)
-
-            with tracer.start_as_current_span("Reading Command Ready Prompt"):
-                while True:
-                    line_bytes = await self._read_line()
-                    line = line_bytes.decode('ascii').strip()
-                    if line == PROMPT:
-                        break
-                    if line == "bad login":
-                        raise ValueError("Bad login")
-                    elif line == "":
-                        continue
-                    else:
-                        logger.debug(f"Unexpected line in login: {line}")
+            await self._read_until(_LOGIN_PROMPT)
+            logger.debug("Sending Username")
+            await self._write_bytes(self._username_bytes)
+
+            await self._read_until(_PASSWORD_PROMPT)
+            logger.debug("Sending Password")
+            await self._write_bytes(self._password_bytes)
+
+            while True:
+                line_bytes = await self._read_line()
+                line = line_bytes.decode('ascii').strip()
+                if line == PROMPT:
+                    break
+                if line == "bad login":
+                    raise ValueError("Bad login")
+                elif line == "":
+                    continue
+                else:
+                    logger.debug(f"Unexpected line in login: {line}")
 
             # Reset the command prompt once after logging in to discard
             # any residual data from the login process (like a \0 char
             # that is showing up attached to the first prompt)
             await self._write(LINE_END)
-            with tracer.start_as_current_span("Reading Command Ready Prompt 2"):
-                await self._read_prompt()
+            await self._read_prompt()
             
             logger.debug("Login complete.")
             self.command_ready = True
@@ -172,14 +302,31 @@ class LutronHomeworksClient:
             return False
 
     async def _read_until(self, end_bytes: bytes, timeout: float | None = None) -> bytes:
-        """Read until the given prompt or timeout."""
+        """Read until the given terminator, the command prompt, or timeout.
 
-        prompt_bytes = PROMPT.encode('ascii')
+        Reads from the stream in large chunks, keeping any bytes beyond the
+        terminator in a residual buffer for the next call.
+        """
 
-        buf = b""
+        buf = self._read_buffer
+        search_start = 0
         try:
-            while not buf.endswith(end_bytes):
-                chunk = await asyncio.wait_for(self.reader.read(1), timeout=timeout)
+            while True:
+                data = self._take_buffered(end_bytes, search_start)
+                if data is not None:
+                    # Guarded so the rstrip allocation only happens when
+                    # debug logging is actually on
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("<< %s", data.rstrip())
+                    return data
+
+                # Resume the next scan where this one left off, backing up
+                # enough to catch a terminator split across chunk boundaries
+                search_start = max(0, len(buf) - max(len(end_bytes), len(_PROMPT_BYTES)) + 1)
+
+                # asyncio.timeout avoids wait_for's per-call task wrapping
+                async with asyncio.timeout(timeout):
+                    chunk = await self.reader.read(4096)
 
                 # No bytes, EOF
                 if not chunk:
@@ -189,17 +336,7 @@ class LutronHomeworksClient:
                 # Any read is a sign of life, reset the heartbeat timer
                 self._heartbeat_sent_event.clear()
 
-                buf += chunk
-                # logger.debug(f"<< CHUNK READ: {chunk} [{len(chunk)}]")
-                if buf.endswith(prompt_bytes):
-                    # Remove the prompt from end of buffer
-                    # logger.debug(f"Discarding prompt... [{prompt_bytes}]")
-                    # buf = buf[:-len(prompt_bytes)]
-                    break
-
-            logger.debug(f"<< {buf.rstrip()}")
-
-            return buf
+                buf.extend(chunk)
         except asyncio.TimeoutError:
             raise TimeoutError(f"Timeout waiting for prompt: {end_bytes}")
         except Exception as e:
@@ -209,59 +346,93 @@ class LutronHomeworksClient:
             else:
                 raise
 
-    async def _read_line(self, timeout: float | None = None) -> bytes:
-        line = await self._read_until(LINE_END.encode('ascii'), timeout=timeout)
-        return line
+    def _take_buffered(self, end_bytes: bytes, search_start: int = 0) -> bytes | None:
+        """Cut and return buffered data through the earliest terminator or
+        command prompt, or None if neither is buffered yet."""
+        buf = self._read_buffer
+        cut = -1
+        end_index = buf.find(end_bytes, search_start)
+        if end_index != -1:
+            cut = end_index + len(end_bytes)
+        prompt_index = buf.find(_PROMPT_BYTES, search_start)
+        if prompt_index != -1:
+            prompt_cut = prompt_index + len(_PROMPT_BYTES)
+            if cut == -1 or prompt_cut < cut:
+                cut = prompt_cut
+        if cut == -1:
+            return None
+        data = bytes(buf[:cut])
+        del buf[:cut]
+        return data
 
-    async def _read_prompt(self, timeout: float | None = None) -> bytes:
-        prompt_bytes = PROMPT.encode('ascii')
-        return await self._read_until(prompt_bytes, timeout=timeout)
-    
     async def _write(self, data: str, timeout: float | None = None) -> None:
-        """Write data to the server with an optional timeout.
-        
+        """Write string data to the server with an optional timeout.
+
         Args:
             data: The string data to write
             timeout: Maximum time to wait for the write operation to complete
-                    (uses self._read_timeout if None)
-                    
+                    (uses self._write_timeout if None)
+
         Raises:
             TimeoutError: If the write operation times out
         """
+        await self._write_bytes(data.encode('ascii'), timeout=timeout)
+
+    async def _write_bytes(self, data: bytes, timeout: float | None = None) -> None:
+        """Write pre-encoded bytes to the server with an optional timeout."""
         if timeout is None:
             timeout = self._write_timeout
-            
-        logger.debug(f">> {data.rstrip()}")
-        async with self._lock:
-            self.writer.write(data.encode('ascii'))
-        
-            try:
-                # Use wait_for to add timeout to drain operation
-                await asyncio.wait_for(self.writer.drain(), timeout=timeout)
-            except asyncio.TimeoutError:
-                logger.error(f"Write operation timed out after {timeout} seconds")
-                raise TimeoutError(f"Write operation timed out after {timeout} seconds")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(">> %s", data.rstrip())
+        # write() synchronously enqueues into the transport and a whole
+        # command goes in with one call, so no lock is needed on the write
+        # path; _lock still guards connection setup and teardown
+        self.writer.write(data)
+
+        try:
+            # asyncio.timeout avoids wait_for's per-call task wrapping
+            async with asyncio.timeout(timeout):
+                await self.writer.drain()
+        except asyncio.TimeoutError:
+            logger.error(f"Write operation timed out after {timeout} seconds")
+            raise TimeoutError(f"Write operation timed out after {timeout} seconds")
 
     def _start_output_emitter(self) -> None:
-        if self._output_emitter_task and not self._output_emitter_task.done():
+        task = self._tasks['output_emitter']
+        if task and not task.done():
             logger.warning("Output emitter task already running.")
             return
-        
-        self._output_emitter_task = asyncio.create_task(
+
+        self._tasks['output_emitter'] = asyncio.create_task(
             self._output_emitter_loop(),
             name="Lutron-OutputEmitter",
         )
     
-    @tracer.start_as_current_span("Output Emitter Loop")
+    @_traced("Output Emitter Loop")
     async def _output_emitter_loop(self) -> None:
+        # One disconnect sentinel task for the whole loop rather than a new
+        # one per received line
+        disconnect_requested_task = asyncio.create_task(
+            self._disconnected_event.wait(),
+            name="Lutron-OutputEmitter-DisconnectRequested",
+        )
+        try:
+            await self._output_emitter_loop_inner(disconnect_requested_task)
+        finally:
+            if not disconnect_requested_task.done():
+                disconnect_requested_task.cancel()
+
+    async def _output_emitter_loop_inner(self, disconnect_requested_task: asyncio.Task) -> None:
+        # Bind hot-path lookups once for the life of the loop
+        read_line = self._read_line
+        take_buffered = self._take_buffered
+        process_output = self._process_output
+
         is_running = True
         while is_running:
-            disconnect_requested_task = asyncio.create_task(
-                self._disconnected_event.wait(),
-                name="Lutron-OutputEmitter-DisconnectRequested",
-            )
             read_task = asyncio.create_task(
-                self._read_line(),
+                read_line(),
                 name="Lutron-OutputEmitter-ReadLine",
             )
 
@@ -270,12 +441,11 @@ class LutronHomeworksClient:
                 return_when=asyncio.FIRST_COMPLETED
             )
 
-            for task in pending:
-                task.cancel()
-            
             if disconnect_requested_task in done:
                 logger.debug("Output emitter loop exiting due to disconnect request")
                 is_running = False
+                if read_task in pending:
+                    read_task.cancel()
 
             # Process read even if disconnect requested to clear the task result
             if read_task in done:
@@ -288,143 +458,210 @@ class LutronHomeworksClient:
                 except TimeoutError:
                     # Read timed out which isn't indicative of an error so try again
                     continue
-                except BaseException as e:
-                    logger.error(f"Error reading from server: {e}")
-                    import traceback
-                    traceback.print_exc()
+                except Exception as e:
+                    logger.exception(f"Error reading from server: {e}")
                     await self._schedule_reset()
                     break
 
                 if not is_running: # Disconnect was requested, no need to proceed
                     break
 
-                try:
-                    event, data = self._parse_output(output)
-                except BaseException as e:
-                    logger.error(f"Error parsing output: {e}")
-                    continue
+                process_output(output)
 
-                if event is None:
-                    self._eventbus.emit(LutronSpecialEvents.NonResponseEvents.value, output)
-                    self._eventbus.emit(LutronSpecialEvents.AllEvents.value, output)
-                    continue
+                # Drain any lines that arrived in the same chunk before
+                # re-arming the read
+                for _ in range(_MAX_BURST_LINES):
+                    buffered = take_buffered(_LINE_END_BYTES)
+                    if buffered is None:
+                        break
+                    process_output(buffered)
 
-                assert event is not None and data is not None, "Parsed output returned invalid event/data"
+            logger.debug(f"Output emitter loop exiting")
 
-                self._eventbus.emit(event, data)
-                # Re-emit the event in parsed format
-                self._eventbus.emit(LutronSpecialEvents.AllEvents.value, data)
-            
-            logger.debug(f"Output emitter loop exiting")   
+    def _process_output(self, output: bytes) -> None:
+        try:
+            event, data = self._parse_output(output)
+        except Exception as e:
+            logger.error(f"Error parsing output: {e}")
+            return
+
+        emit = self._eventbus.emit
+        if event is None:
+            emit(self._ev_nonresp, output)
+            emit(self._ev_all, output)
+            return
+
+        assert event is not None and data is not None, "Parsed output returned invalid event/data"
+
+        emit(event, data)
+        # Re-emit the event in parsed format
+        emit(self._ev_all, data)
 
     def _parse_output(self, output: bytes) -> tuple[str, Any] | tuple[None, None]:
-        line = output.decode('ascii').strip()
+        # Work on bytes until the line is known to be a command response;
+        # most lines are rejected without paying for a decode
+        line = output.strip()
         if not line:
             return (None, None)
 
-        if line.startswith(PROMPT):
-            self._eventbus.emit(LutronSpecialEvents.CommandPrompt.value, None)
+        # Classify on the first byte; only full-compare on a match
+        first = line[0]
+        if first != _RESPONSE_FIRST_BYTE:
+            if first == _PROMPT_FIRST_BYTE and line.startswith(_PROMPT_BYTES):
+                self._eventbus.emit(self._ev_prompt, None)
             return (None, None)
 
-        if not line.startswith(COMMAND_RESPONSE_PREFIX):
-            return (None, None)
-        
-        parts = line.split(',')
-        event = parts[0][1:]
-        data = self._infer_data(parts[1:])
+        # Single pass: decode once, take the event name off the front, then
+        # coerce the remaining tokens without an intermediate slice. A tuple
+        # keeps the parsed data immutable for the subscribers it fans out to.
+        parts = iter(line.decode('ascii').split(','))
+        event = next(parts)[1:]
+        data = tuple(map(_coerce, parts))
 
         return (event, data)
-    
-    def _infer_data(self, parts: List[str]) -> List[Any]:
-        result = []
-
-        for part in parts:
-            value: Any = part
-            if RE_IS_INTEGER.match(part):
-                value = int(part)
-            elif RE_IS_FLOAT.match(part):
-                value = float(part)
-            result.append(value)
-
-        return result
-    
+
     def _start_keepalive(self) -> None:
-        if self._keepalive_task and not self._keepalive_task.done():
+        task = self._tasks['keepalive']
+        if task and not task.done():
             logger.warning("Keepalive task already running.")
             return
-        
-        self._keepalive_task = asyncio.create_task(
+
+        self._tasks['keepalive'] = asyncio.create_task(
             self._keepalive_loop(),
             name="Lutron-Keepalive",
         )
 
-    @tracer.start_as_current_span("Keepalive Loop")
+    @_traced("Keepalive Loop")
     async def _keepalive_loop(self) -> None:
-        async def do_keepalive() -> None:
-            # logger.debug(f"Keepalive: Sending heartbeat [{self.keepalive_interval} seconds]")
-            await asyncio.sleep(self.keepalive_interval)
+        while True:
+            try:
+                # Waiting on the disconnect event doubles as the heartbeat
+                # timer; no per-interval tasks required
+                await asyncio.wait_for(
+                    self._disconnected_event.wait(),
+                    timeout=self.keepalive_interval,
+                )
+                logger.debug("Keepalive loop exiting due to disconnect request")
+                return
+            except asyncio.TimeoutError:
+                pass
 
             if self._heartbeat_sent_event.is_set():
                 # Previous keep alive was not acknowledged, reset connection
                 logger.warning("Keepalive: Previous keep alive was not acknowledged, resetting connection")
                 await self._schedule_reset()
                 return
-            
-            await self._send_heartbeat()
-
-        is_running = True
-        while is_running:
-            disconnect_requested_task = asyncio.create_task(
-                self._disconnected_event.wait(),
-                name="Lutron-Keepalive-DisconnectRequested",
-            )
-            keepalive_task = asyncio.create_task(
-                do_keepalive(),
-                name="Lutron-Keepalive-DoKeepalive",
-            )
-
-            done, pending = await asyncio.wait(
-                [disconnect_requested_task, keepalive_task],
-                return_when=asyncio.FIRST_COMPLETED
-            )
-
-            for task in pending:
-                task.cancel()
-            
-            if disconnect_requested_task in done:
-                logger.debug("Keepalive loop exiting due to disconnect request")
-                is_running = False
 
-            # Check for keepalive failure
-            if keepalive_task in done:
-                try:
-                    result = keepalive_task.result()
-                except Exception as e:
-                    logger.warning(f"Keepalive failed: {e}")
-                    await self._schedule_reset()
-                    is_running = False
+            try:
+                await self._send_heartbeat()
+            except Exception as e:
+                logger.warning(f"Keepalive failed: {e}")
+                await self._schedule_reset()
+                return
 
-    @tracer.start_as_current_span("Send Heartbeat")
     async def _send_heartbeat(self) -> None:
         """Send a keep-alive/heartbeat command. Customize as needed."""
         if self.connected and self.command_ready:
             logger.debug("Sending heartbeat...")
             self._heartbeat_sent_event.set()
-            await self.send_raw("")
+            # A heartbeat is just a bare line ending; skip the send_raw
+            # formatting and tracing for this periodic two-byte write
+            await self._write_bytes(_LINE_END_BYTES)
 
     async def _send_logout(self) -> None:
         if self.connected and self.command_ready:
             logger.debug("Sending logout command...")
             await self.send_raw("LOGOUT")
 
-    @tracer.start_as_current_span("Send Command")
-    async def send_raw(self, command: str) -> None:
-        if not self.connected or self.writer is None:
+    def _start_tx_writer(self) -> None:
+        task = self._tasks['tx_writer']
+        if task and not task.done():
+            logger.warning("Tx writer task already running.")
+            return
+
+        self._tx_queue = asyncio.Queue()
+        self._tasks['tx_writer'] = asyncio.create_task(
+            self._tx_writer_loop(),
+            name="Lutron-TxWriter",
+        )
+
+    async def _tx_writer_loop(self) -> None:
+        """Drain queued commands, coalescing whatever is already waiting
+        into a single write + drain."""
+        queue = self._tx_queue
+        assert queue is not None
+        waiters: list[asyncio.Future] = []
+        try:
+            while True:
+                data, future = await queue.get()
+                payload = bytearray(data)
+                if future is not None:
+                    waiters.append(future)
+
+                while True:
+                    try:
+                        data, future = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    payload.extend(data)
+                    if future is not None:
+                        waiters.append(future)
+
+                try:
+                    await self._write_bytes(bytes(payload))
+                except Exception as e:
+                    if not waiters:
+                        # Fire-and-forget payload: no future will surface
+                        # this, so record the failure here
+                        logger.error("Write failed for queued command(s): %s", e)
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(None)
+                waiters.clear()
+        except asyncio.CancelledError:
+            exc = ConnectionError("Connection closed.")
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(exc)
+            # Also fail anything still sitting in the queue; items enqueued
+            # while teardown raced this task would otherwise wait forever
+            while True:
+                try:
+                    _, future = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if future is not None and not future.done():
+                    future.set_exception(exc)
+            raise
+
+    @_traced("Send Command")
+    async def send_raw(self, command: str, drain: bool = True) -> None:
+        """Send a raw command line.
+
+        With drain=False the command is queued for the writer task but the
+        call returns without waiting for it to reach the socket; useful for
+        fire-and-forget commands that expect no response.
+        """
+        if not self.connected or self._writer is None:
             raise ConnectionError("Not connected to Lutron server.")
-        await self._write(command + LINE_END)
-        logger.debug(f"Command sent: {command}")
 
-    @tracer.start_as_current_span("Execute Command")
+        data = (command + LINE_END).encode('ascii')
+        queue = self._tx_queue
+        if queue is None:
+            await self._write_bytes(data)
+        elif drain:
+            future = asyncio.get_running_loop().create_future()
+            queue.put_nowait((data, future))
+            await future
+        else:
+            queue.put_nowait((data, None))
+        logger.debug("Command sent: %s", command)
+
+    @_traced("Execute Command")
     async def execute_command(self, command: 'LutronCommand', timeout: float = 5.0):
         """
         Execute a Lutron command and return the response.
@@ -459,12 +696,15 @@ class LutronHomeworksClient:
         """
         Subscript to events announced by the Lutron Homeworks server.
         """
-        if ((isinstance(event_name, type) and issubclass(event_name, LutronCommand))
-            or isinstance(event_name, LutronCommand)):
-            event_name = event_name.schema.command_name
+        # Duck-typed resolution: anything carrying a schema (LutronCommand
+        # classes and instances) resolves to its command name, avoiding the
+        # issubclass/isinstance ladder
+        schema = getattr(event_name, 'schema', None)
+        if schema is not None:
+            event_name = schema.command_name
         elif isinstance(event_name, LutronSpecialEvents):
             event_name = event_name.value
-        
+
         return self._eventbus.subscribe(event_name, callback)
 
     def unsubscribe(self, token: SubscriptionToken):
@@ -479,7 +719,8 @@ class LutronHomeworksClient:
         Args:
             delay: Initial delay before reconnection attempt (seconds)
         """
-        if self._reconnect_task and not self._reconnect_task.done():
+        task = self._tasks['reconnect']
+        if task and not task.done():
             return
 
         delay = self._reconnect_params['current_delay']
@@ -509,7 +750,7 @@ class LutronHomeworksClient:
                 # Next reconnection attempt will be scheduled by the connect method
                 # if it fails with an exception
         
-        self._reconnect_task = asyncio.create_task(
+        self._tasks['reconnect'] = asyncio.create_task(
             reconnect(),
             name="Lutron-Reconnect",
         )
@@ -523,24 +764,30 @@ class LutronHomeworksClient:
             logger.info("Scheduling reconnection...")
             self._schedule_reconnect()
         
-        self._reset_task = asyncio.create_task(
+        self._tasks['reset'] = asyncio.create_task(
             do_reset(),
             name="Lutron-Reset",
         )
 
-    @tracer.start_as_current_span('Disconnect')
+    @_traced('Disconnect')
     async def disconnect(self) -> None:
         logger.info("Disconnecting Lutron client...")
 
         await self._teardown(full_shutdown=False)
 
-    @tracer.start_as_current_span("Close")
+    @_traced("Close")
     async def close(self) -> None:
         logger.info("Closing Lutron client...")
 
         await self._teardown(full_shutdown=True)
 
     async def _teardown(self, full_shutdown: bool = False) -> None:
+        # Flip connected off first so a send racing teardown fails the
+        # "Not connected" check instead of enqueueing to a writer task
+        # that is about to be cancelled
+        self.connected = False
+        self.command_ready = False
+
         self._disconnected_event.set()
         if full_shutdown:
             self._stop_event.set()
@@ -551,6 +798,12 @@ class LutronHomeworksClient:
         # logger.debug("Teardown: cancel tasks")
         await self._cancel_tasks(include_reconnect=full_shutdown)
 
+        # Drop the dead queue so a send issued before the next writer task
+        # starts (e.g. mid-reconnect, after connect() flips connected back
+        # on) takes the direct write path instead of enqueueing into a
+        # queue nothing will ever drain
+        self._tx_queue = None
+
         # Close connection
         # logger.debug("Teardown: Destroy IO")
         async with self._lock:
@@ -566,75 +819,54 @@ class LutronHomeworksClient:
             if self._reader:
                 self._reader = None
 
-        self.connected = False
-        self.command_ready = False
-
     async def _try_gather_tasks(self, full_shutdown: bool = False, timeout: float = 0.25) -> None:
         # Attempt to gather all tasks
         try:
-            tasks = []
-            if self._keepalive_task and not self._keepalive_task.done():
-                tasks.append(self._keepalive_task)
-            if self._output_emitter_task and not self._output_emitter_task.done():
-                tasks.append(self._output_emitter_task)
-            if full_shutdown and self._reconnect_task and not self._reconnect_task.done():
-                tasks.append(self._reconnect_task)
+            # The reset task drives teardown itself and the tx writer only
+            # stops via cancellation, so neither is gathered
+            tasks = [
+                task for name, task in self._tasks.items()
+                if task and not task.done()
+                and name not in ('reset', 'tx_writer')
+                and (full_shutdown or name != 'reconnect')
+            ]
             
             if not tasks:
                 return
-            
-            gather_task = asyncio.gather(*tasks, return_exceptions=True)
 
-            # Wait for either the gather task to complete or the timeout to elapse
-            try: 
-                await asyncio.wait_for(gather_task, timeout)
-            except asyncio.TimeoutError:
+            # Wait on all tasks at once; stragglers are left for
+            # _cancel_tasks rather than cancelled here
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+            if pending:
                 logger.info("Task gathering timed out")
-                gather_task.cancel()
 
-            try:
-                await gather_task
-            except asyncio.CancelledError:
-                # logger.debug("Gather cancelled")
-                pass
-            except Exception as e:
-                logger.warning(f"Error gathering tasks: {e}")
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    logger.warning(f"Error gathering tasks: {task.exception()}")
 
         except asyncio.CancelledError:
             # logger.debug("Gather cancelled")
             pass
         except Exception as e:
-            import traceback
-            traceback.print_exc()
-            logger.warning(f"Unhandled exception gathering tasks: {e}")
+            logger.exception(f"Unhandled exception gathering tasks: {e}")
 
     async def _cancel_tasks(self, include_reconnect: bool = False) -> None:
         cancelled_tasks = []
+
+        for name, task in self._tasks.items():
+            if name == 'reset' or (name == 'reconnect' and not include_reconnect):
+                continue
+            if task and not task.done():
+                logger.debug(f"Cancelling {name} task")
+                task.cancel()
+                cancelled_tasks.append(task)
         
-        if self._keepalive_task and not self._keepalive_task.done():
-            logger.debug("Cancelling keepalive task")
-            self._keepalive_task.cancel()
-            cancelled_tasks.append(self._keepalive_task)
-        
-        if self._output_emitter_task and not self._output_emitter_task.done():
-            logger.debug("Cancelling output emitter task")
-            self._output_emitter_task.cancel()
-            cancelled_tasks.append(self._output_emitter_task)
-        
-        if include_reconnect and self._reconnect_task and not self._reconnect_task.done():
-            logger.debug("Cancelling reconnect task")
-            self._reconnect_task.cancel()
-            cancelled_tasks.append(self._reconnect_task)
-        
-        # Wait for all tasks to complete their cancellation
+        # Wait for all tasks to complete their cancellation in one pass
         if cancelled_tasks:
             try:
-                for task in cancelled_tasks:
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-                    except Exception as e:
-                        logger.warning(f"Error cancelling task: {e}")
+                done, _ = await asyncio.wait(cancelled_tasks)
+                for task in done:
+                    if not task.cancelled() and task.exception() is not None:
+                        logger.warning(f"Error cancelling task: {task.exception()}")
             except Exception as e:
                 logger.warning(f"Error during task cancellation cleanup: {e}")
\ No newline at end of file
@@ -1,6 +1,5 @@
 import asyncio
 from enum import Enum
-from statistics import fmean
 from typing import Any, List, Union
 
 from ..types import (
@@ -18,7 +17,12 @@ class AreaAction(Enum):
     START_LOWER      = 3          # Set Start lowering
     STOP_RAISE_LOWER = 4          # Set Stop raising/lowering
     SCENE            = 6          # Set/Get Scene
-    
+
+# Accepts raw ints and AreaAction members alike; avoids the enum
+# constructor's try/except on the bulk command-creation path
+_ACTION_LOOKUP: dict[Union[int, AreaAction], AreaAction] = {a.value: a for a in AreaAction}
+_ACTION_LOOKUP.update({a: a for a in AreaAction})
+
 area_command_definitions = [
     Cmd(AreaAction.ZONE_LEVEL, None),
     Cmd.SET(AreaAction.START_RAISE, None, no_response=True),
@@ -32,6 +36,8 @@ schema = CommandSchema("AREA,{iid},{action}", area_command_definitions)
 
 class AreaCommand(LutronCommand[AreaAction], schema=schema):
 
+    __slots__ = ('iid',)
+
     def __init__(self, iid: int, action: Union[int, AreaAction]):
         """
         Initialize an area command.
@@ -40,15 +46,8 @@ class AreaCommand(LutronCommand[AreaAction], schema=schema):
             action (Union[int, AreaAction]): Area action to perform. Either a value from 
                 AreaAction or an integer value corresponding to an action.
         """
-        # Convert int to enum if needed
-        if isinstance(action, int):
-            try: 
-                area_action = AreaAction(action)
-            except ValueError:
-                raise ValueError(f"Invalid area action: {action}")
-        elif isinstance(action, AreaAction):
-            area_action = action
-        else:
+        area_action = _ACTION_LOOKUP.get(action)
+        if area_action is None:
             raise ValueError(f"Invalid area action: {action}")
 
         super().__init__(action=area_action)
@@ -138,26 +137,30 @@ class AreaCommand(LutronCommand[AreaAction], schema=schema):
     def _multi_output_aggregator(cls, context: ExecuteContext):
 
         collected_outputs = []
+        level_total = 0.0
+        new_output = asyncio.Event()
         def _collect_output(event_data: List[Any], future: asyncio.Future, unsubscribe_all: UnsubscribeFnT):
-            nonlocal collected_outputs
+            nonlocal level_total
             if event_data[1] == OutputAction.ZONE_LEVEL.value:
                 collected_outputs.append(event_data)
-         
+                level_total += event_data[2]
+                new_output.set()
+
         async def _command_complete(event_data: Any, future: asyncio.Future, unsubscribe_all: UnsubscribeFnT):
-            # Implement a busy loop to wait for outputs to stabilize
-            prev_count = -1
-            current_count = len(collected_outputs)
-            
-            # Keep checking for new outputs until we stop receiving them or max iterations reached
-            while current_count > prev_count:
-                prev_count = current_count
-                await asyncio.sleep(0.1)  # Wait a short time
-                current_count = len(collected_outputs)
-            
-            # Once outputs have stabilized, calculate the average
+            # Debounce: outputs have stabilized once a full quiet window
+            # passes with no new output event
+            while True:
+                new_output.clear()
+                try:
+                    await asyncio.wait_for(new_output.wait(), timeout=0.1)
+                except asyncio.TimeoutError:
+                    break
+
+            # Once outputs have stabilized, calculate the average from the
+            # running total rather than a second pass over the outputs
             average_level = None
             if len(collected_outputs) > 0:
-                average_level = fmean([output[2] for output in collected_outputs])
+                average_level = level_total / len(collected_outputs)
             unsubscribe_all()
 
             if not future.done():
@@ -2,6 +2,7 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
+import re
 from typing import (
     Any,
     ClassVar,
@@ -70,15 +71,20 @@ class CommandResponseProcessors:
     
     @classmethod
     def to_time(cls, data: Any) -> datetime.time:
+        # Formats are fixed (HH:MM:SS), so split+int beats strptime's
+        # per-call format parsing
         try:
-            return datetime.datetime.strptime(data, "%H:%M:%S").time()
+            hour, minute, second = data.split(':')
+            return datetime.time(int(hour), int(minute), int(second))
         except ValueError:
             raise ValueError(f"Invalid time value: {data}")
-    
+
     @classmethod
     def to_date(cls, data: Any) -> datetime.date:
+        # Fixed MM/DD/YYYY format; see to_time
         try:
-            return datetime.datetime.strptime(data, "%m/%d/%Y").date()
+            month, day, year = data.split('/')
+            return datetime.date(int(year), int(month), int(day))
         except ValueError:
             raise ValueError(f"Invalid date value: {data}")
     
@@ -106,6 +112,55 @@ class CommandResponseProcessors:
             raise ValueError(f"Invalid timezone offset value: {data}") from e
 
 
+# Matches a whole "{field}" template part
+_FIELD_RE = re.compile(r'\{([^}]+)\}')
+
+# Sentinel distinguishing "key absent" from a stored None
+_MISSING = object()
+
+
+class _ResponseHandler:
+    """Slotted callable binding a command's future and cleanup to
+    handle_response; cheaper than a fresh closure per execute."""
+    __slots__ = ('command', 'future', 'unsubscribe')
+
+    def __init__(self, command: 'LutronCommand', future: asyncio.Future,
+                 unsubscribe: Callable[[], None]):
+        self.command = command
+        self.future = future
+        self.unsubscribe = unsubscribe
+
+    def __call__(self, event_data: List[Any]) -> None:
+        self.command.handle_response(event_data, self.future, self.unsubscribe)
+
+
+class _ErrorHandler:
+    """Slotted callable binding a command's future and cleanup to handle_error."""
+    __slots__ = ('command', 'future', 'unsubscribe')
+
+    def __init__(self, command: 'LutronCommand', future: asyncio.Future,
+                 unsubscribe: Callable[[], None]):
+        self.command = command
+        self.future = future
+        self.unsubscribe = unsubscribe
+
+    def __call__(self, event_data: List[Any]) -> None:
+        self.command.handle_error(event_data, self.future, self.unsubscribe)
+
+
+class _CustomHandlerWrapper:
+    """Slotted callable adapting a custom handler to the event callback shape."""
+    __slots__ = ('handler', 'future', 'unsubscribe')
+
+    def __init__(self, handler: CustomHandlerT, future: asyncio.Future,
+                 unsubscribe: Callable[[], None]):
+        self.handler = handler
+        self.future = future
+        self.unsubscribe = unsubscribe
+
+    def __call__(self, param: Union[bytes, List[Any], None]) -> None:
+        self.handler(param, self.future, self.unsubscribe)
+
 class CommandSchema:
     """
     Defines the schema for a Lutron Homeworks command.  A string format template
@@ -140,9 +195,35 @@ class CommandSchema:
         
         # Parse template to get field positions
         self.response_index_map: Dict[int, str] = self._parse_template(format_template)
+        # Field names in response order, computed once per schema
+        self._ordered_fields: List[str] = [
+            self.response_index_map[key] for key in sorted(self.response_index_map)
+        ]
+        # Reverse map for O(1) field-name-to-index lookups
+        self._field_to_index: Dict[str, int] = {
+            field: i for i, field in self.response_index_map.items()
+        }
         self.commands = {cmd.action: cmd for cmd in commands}
-        
+
+        # Dense table indexed by action value; action enums are small ints,
+        # so this turns the per-command dict probe into a list index
+        self._commands_by_value: List[CommandDefinition | None] | None = None
+        values = [
+            cmd.action.value for cmd in commands
+            if isinstance(cmd.action, Enum) and isinstance(cmd.action.value, int)
+        ]
+        if len(values) == len(commands) and values and 0 <= min(values) and max(values) <= 64:
+            table: List[CommandDefinition | None] = [None] * (max(values) + 1)
+            for cmd in commands:
+                table[cmd.action.value] = cmd
+            self._commands_by_value = table
+
     def command_def(self, action: Union[int, Enum]) -> CommandDefinition | None:
+        table = self._commands_by_value
+        if table is not None:
+            value = action.value if isinstance(action, Enum) else action
+            if isinstance(value, int) and 0 <= value < len(table):
+                return table[value]
         return self.commands.get(action)
     
     def _parse_template(self, template: str) -> Dict[int, str]:
@@ -155,29 +236,26 @@ class CommandSchema:
         # Skip first part (command name) and start from index 1
         for i, part in enumerate(parts[1:], 1):
             # Extract field name from {field} format
-            field = part.strip()
-            if field.startswith('{') and field.endswith('}'): 
-                field_name = field[1:-1]  # Remove { and }
-                
+            match = _FIELD_RE.fullmatch(part.strip())
+            if match:
+                field_name = match.group(1)
+
                 # Handle parameters... special case
                 if field_name.endswith('...'):
                     field_name = field_name[:-3]  # Remove ...
                     index_map[i] = f"{field_name}_start"
                 else:
                     index_map[i] = field_name
-        
+
         return index_map
         
     def get_field_index(self, field_name: str) -> int | None:
         """Get the index of a named field in the response."""
-        for i, field in self.response_index_map.items():
-            if field == field_name:
-                return i
-        return None
+        return self._field_to_index.get(field_name)
 
     def get_field_order(self) -> List[str]:
         """Get the order of fields in the response."""
-        return [self.response_index_map[key] for key in sorted(self.response_index_map)]
+        return self._ordered_fields
         
     @property
     def command_name(self) -> str:
@@ -194,6 +272,8 @@ class UnspecifiedCommandSchema(CommandSchema):
         # Just set up the minimum properties needed to avoid attribute errors
         self.format_template: str = ""
         self.response_index_map: Dict[int, str] = {}
+        self._ordered_fields: List[str] = []
+        self._field_to_index: Dict[str, int] = {}
         self._command_name: str = "UNSPECIFIED"
     
     def get_field_index(self, field_name: str) -> int | None:
@@ -208,13 +288,43 @@ class UnspecifiedCommandSchema(CommandSchema):
 
 class LutronCommand(Generic[ActionT]):
     """Base class for Lutron Homeworks commands."""
-    
+
+    __slots__ = (
+        'action',
+        'definition',
+        'processor',
+        'no_response',
+        'command_type',
+        '_prefix',
+        'set_params',
+        '_logger',
+        'custom_event',
+        'custom_handler',
+        'execute_hook',
+        '_formatted',
+        '_match_spec',
+        '_action_value',
+    )
+
     # Subclasses should define these as class variables
     schema: ClassVar[CommandSchema]
 
+    # Cached from the schema at class-creation time so lookups are a single
+    # attribute access (e.g., "SYSTEM", "OUTPUT")
+    command_name: ClassVar[str]
+
     response_processors: ClassVar[Dict[Any, Callable[[List[Any]], Any]]] = {}
 
     _config: ClassVar[Dict[str, Any]] = {}
+
+    # Flattened view of _config ("command.no_response_timeout" -> value) so
+    # hot lookups are a single dict probe instead of a nested walk
+    _flat_config: ClassVar[Dict[str, Any]] = {}
+
+    # Shared response/error dispatch: one client subscription per
+    # (client, event) pair, fanned out to every command awaiting it
+    _pending_handlers: ClassVar[Dict[Tuple[int, str], List[Callable[[List[Any]], None]]]] = {}
+    _pending_tokens: ClassVar[Dict[Tuple[int, str], Any]] = {}
     
     def __init_subclass__(cls, schema: CommandSchema, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -224,7 +334,8 @@ class LutronCommand(Generic[ActionT]):
             raise TypeError("Command schema must be specified for subclass")
 
         cls.schema = schema
-        
+        cls.command_name = schema.command_name
+
     def __init__(self, action: Union[int, ActionT]):
         """
         Initialize base command with action and parameters.
@@ -236,6 +347,10 @@ class LutronCommand(Generic[ActionT]):
 
         self.action = action
 
+        # Numeric/string form of the action, unwrapped once so hot paths
+        # skip the per-use isinstance check and .value fetch
+        self._action_value = action.value if isinstance(action, Enum) else action
+
         definition = self.schema.command_def(action)
         if definition is None:
             raise ValueError(f"Action {action} not found in schema")
@@ -244,11 +359,14 @@ class LutronCommand(Generic[ActionT]):
         self.processor = self.definition.processor
         self.no_response = self.definition.no_response
 
-        # Default to query/read until otherwise specified.
+        # Default to query/read until otherwise specified. The wire prefix
+        # is frozen alongside command_type rather than re-derived per format.
         if self.definition.is_get:
             self.command_type = CommandType.QUERY
+            self._prefix = COMMAND_QUERY_PREFIX
         elif self.definition.is_set:
             self.command_type = CommandType.EXECUTE
+            self._prefix = COMMAND_EXECUTE_PREFIX
         else:
             raise ValueError(f"Action {action} is not a valid get or set action")
         
@@ -258,38 +376,38 @@ class LutronCommand(Generic[ActionT]):
         self.custom_event: str | None = None
         self.custom_handler: CustomHandlerT | None = None
 
+        # Memoized wire form; invalidated when set() changes the command
+        self._formatted: str | None = None
+
+        # Lazily built match spec for _matches_response (subclass fields
+        # like iid are only set after this constructor runs)
+        self._match_spec: Tuple[List[Tuple[int, str, str]], int] | None = None
+
         self.execute_hook: ExecuteHookT = self._default_execute_hook
         
 
-    @property
-    def command_name(self) -> str:
-        """
-        Return the command type string (e.g., "SYSTEM", "OUTPUT").
-        
-        Uses schema's command_name which is extracted from the format template.
-        """
-        return self.schema.command_name
-    
     @property
     def formatted_command(self) -> str:
-        """Format command string from components using the schema."""
-        # Choose prefix based on command type
-        if self.command_type == CommandType.QUERY:
-            prefix = COMMAND_QUERY_PREFIX
-        elif self.command_type == CommandType.EXECUTE:
-            prefix = COMMAND_EXECUTE_PREFIX
-        else:  # Response
-            prefix = COMMAND_RESPONSE_PREFIX
-            
+        """Format command string from components using the schema.
+
+        The result is memoized; set() invalidates it.
+        """
+        if self._formatted is not None:
+            return self._formatted
+
+        prefix = self._prefix
+
         # Use schema for formatting - building from left to right
         result = [self.schema.command_name]
         
         all_fields_present = True
-        schema_map = self.schema.response_index_map
-        ordered_fields = [schema_map[key] for key in sorted(schema_map)]
-        for field in ordered_fields:
+        for field in self.schema.get_field_order():
+            if field == 'action':
+                result.append(self._action_value)
+                continue
+
             if not hasattr(self, field):
-                print(f"Field {field} not found")
+                self._logger.debug("Field %s not found", field)
                 all_fields_present = False
                 break
 
@@ -299,15 +417,34 @@ class LutronCommand(Generic[ActionT]):
             
         if all_fields_present and self.set_params:
             result.extend(self.set_params)
-        
-        return f"{prefix}{','.join([str(x) for x in result])}"
+
+        self._formatted = f"{prefix}{','.join(map(str, result))}"
+        return self._formatted
 
     @classmethod
     def set_configuration(cls, config: Dict[str, Any]):
         cls._config = config
-    
+        cls._flat_config = cls._flatten_configuration(config)
+
+    @staticmethod
+    def _flatten_configuration(config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        flat: Dict[str, Any] = {}
+        for key, value in config.items():
+            full_key = f"{prefix}{key}"
+            if isinstance(value, dict):
+                flat.update(LutronCommand._flatten_configuration(value, f"{full_key}."))
+            else:
+                flat[full_key] = value
+        return flat
+
     @classmethod
     def get_configuration(cls, key: str, default: Any = None) -> Any:
+        value = cls._flat_config.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        # Fall back to the nested walk so misses keep their original
+        # semantics (e.g., erroring when a path crosses a non-dict value)
         key_parts = key.split('.')
         current = cls._config
         for part in key_parts[:-1]:
@@ -322,7 +459,9 @@ class LutronCommand(Generic[ActionT]):
         assert self.definition.is_set, f"Action {self.action} is not a valid set action"
 
         self.command_type = CommandType.EXECUTE
+        self._prefix = COMMAND_EXECUTE_PREFIX
         self.set_params = set_params
+        self._formatted = None
         return self
     
     def _matches_response(self, event_data: List[Any]) -> Tuple[bool, List[Any]]:
@@ -341,32 +480,54 @@ class LutronCommand(Generic[ActionT]):
         Default implementation compares command name and matches each field in the schema
         with values from event_data. Derived classes can override this for special cases.
         """
-        # Check for field matches based on schema
+        spec = self._match_spec
+        if spec is None:
+            spec = self._match_spec = self._build_match_spec()
+        checks, rest_index = spec
+
+        # Compare the precomputed expected strings against the event data.
+        # A first-field mismatch is routine fan-out (another command's
+        # response) and exits without the warning-log overhead.
+        for i, (idx, field_name, expected) in enumerate(checks):
+            if str(event_data[idx]) != expected:
+                if i:
+                    self._logger.warning(f"Field {field_name} does not match: {event_data[idx]} != {expected}")
+                return False, []
+
+        # All specified fields match
+        return True, event_data[rest_index:]
+
+    def _build_match_spec(self) -> Tuple[List[Tuple[int, str, str]], int]:
+        """Pre-stringify this command's schema field values once, so each
+        incoming event only pays for the comparisons themselves.
+
+        Returns (checks, rest_index) where checks holds
+        (event index, field name, expected string) triples and rest_index
+        is where unmatched response data begins.
+        """
+        checks: List[Tuple[int, str, str]] = []
+        rest_index = len(self.schema.response_index_map)
         for idx, field_name in enumerate(self.schema.get_field_order()):
             # Skip special fields
             if field_name.endswith('_start'):
                 self._logger.warning(f"Skipping special field {field_name}")
                 continue
-            
-            # Get field value from command
-            if hasattr(self, field_name):
-                attr_value = getattr(self, field_name)
-                field_value = attr_value.value if isinstance(attr_value, Enum) else attr_value
+
             # TODO: check field values from set_params values
+            if not hasattr(self, field_name):
+                # Remaining schema fields have no values on this command;
+                # response data starts here
+                rest_index = idx
+                break
+
+            if field_name == 'action':
+                field_value = self._action_value
             else:
-                # All fields in schema matched values present in object
-                # Ignoring remaining fields in schema
-                # print(f"Matches 1: True, Unmatched data: {event_data[idx:]} Event Data: {event_data} Index: {idx}")
-                return True, event_data[idx:]
-            
-            # Match field value with event data
-            if str(event_data[idx]) != str(field_value):
-                self._logger.warning(f"Field {field_name} does not match: {event_data[idx]} != {field_value}")
-                return False, []
-        
-        # All specified fields match
-        # print(f"Matches 2: True, Unmatched data: {event_data[len(self.schema.response_index_map):]}")
-        return True, event_data[len(self.schema.response_index_map):]
+                attr_value = getattr(self, field_name)
+                field_value = attr_value.value if isinstance(attr_value, Enum) else attr_value
+            checks.append((idx, field_name, str(field_value)))
+
+        return checks, rest_index
 
     def handle_response(self, event_data: List[Any], future: asyncio.Future, unsubscribe_func: Callable[[], None]):
         """Handle a response event."""
@@ -380,7 +541,6 @@ class LutronCommand(Generic[ActionT]):
         try:
             # Check if the event matches this command's expected response
             matches, unmatched_data = self._matches_response(event_data)
-            # print(f"Matches: {matches}, Unmatched data: {unmatched_data}")
             if not matches:
                 # Not a match for our command
                 self._logger.debug(f"Response does not match: {event_data}")
@@ -445,6 +605,46 @@ class LutronCommand(Generic[ActionT]):
             self._logger.exception(f"Error processing response: {e}")
             return response_data
 
+    @classmethod
+    def _add_pending(cls, client: LutronHomeworksClient, event: str,
+                     handler: Callable[[List[Any]], None]) -> Callable[[], None]:
+        """Register a handler for an event on the shared dispatcher.
+
+        The first pending command for a (client, event) pair creates the
+        client subscription; the last one to be removed tears it down.
+        Returns a zero-argument removal callback.
+        """
+        key = (id(client), event)
+        handlers = cls._pending_handlers.get(key)
+        if handlers is None:
+            handlers = []
+            cls._pending_handlers[key] = handlers
+            cls._pending_tokens[key] = client.subscribe(
+                event,
+                lambda event_data: cls._dispatch_pending(key, event_data),
+            )
+        handlers.append(handler)
+
+        def remove() -> None:
+            try:
+                handlers.remove(handler)
+            except ValueError:
+                return
+            if not handlers and cls._pending_handlers.get(key) is handlers:
+                del cls._pending_handlers[key]
+                client.unsubscribe(cls._pending_tokens.pop(key))
+
+        return remove
+
+    @classmethod
+    def _dispatch_pending(cls, key: Tuple[int, str], event_data: List[Any]) -> None:
+        handlers = cls._pending_handlers.get(key)
+        if not handlers:
+            return
+        # Snapshot since handlers remove themselves on completion
+        for handler in tuple(handlers):
+            handler(event_data)
+
     async def execute(self, lutron_client: LutronHomeworksClient, timeout: float = 5.0):
         """
         Execute the command and return a response.
@@ -464,82 +664,84 @@ class LutronCommand(Generic[ActionT]):
         # Create a future to track command completion
         future = asyncio.Future()
         
-        # Keep track of event subscription tokens for cleanup
+        # Keep track of event subscription tokens and shared-dispatcher
+        # registrations for cleanup
         event_tokens = []
-        
+        cleanup_fns = []
+
         # Function to clean up subscriptions
         def unsubscribe_all():
             for token in event_tokens:
                 lutron_client.unsubscribe(token)
+            event_tokens.clear()
+            while cleanup_fns:
+                cleanup_fns.pop()()
 
-        context = ExecuteContext(lutron_client, event_tokens, future, unsubscribe_all)
+        context = ExecuteContext(lutron_client, event_tokens, future, unsubscribe_all, cleanup_fns)
 
         formatted_command = self.formatted_command
-        
-        # Create closures that bind this future and unsubscribe function
-        # response_handler = lambda event_data: self.handle_response(event_data, future, unsubscribe_all)
-        error_handler = lambda event_data: self.handle_error(event_data, future, unsubscribe_all)
-        
-        # Subscribe to relevant events
-        # if not self.no_response:
-        #     event_tokens.append(lutron_client.subscribe(self.command_name, response_handler))
+
+        # Register on the shared dispatchers for response and error events
         self.execute_hook(context)
-        event_tokens.append(lutron_client.subscribe("ERROR", error_handler))
-        
+        cleanup_fns.append(self._add_pending(
+            lutron_client, "ERROR", _ErrorHandler(self, future, unsubscribe_all)))
+
         if self.custom_handler is not None:
-            custom_handler: CustomHandlerT = self.custom_handler
             subscribe_event = self.command_name
             if self.custom_event:
                 subscribe_event = self.custom_event
-            wrapper: Callable[[Union[bytes, List[Any]]], None] = lambda param: custom_handler(param, future, unsubscribe_all)
+            wrapper = _CustomHandlerWrapper(self.custom_handler, future, unsubscribe_all)
             event_tokens.append(lutron_client.subscribe(subscribe_event, wrapper))
         
-        # Send the command and handle any immediate errors
-        try:
-            await lutron_client.send_raw(formatted_command)
-        except Exception as e:
-            # If command sending fails, set the exception on the future
-            unsubscribe_all()
-            future.set_exception(e)
-        
-        # Set up timeout handling
-        timeout_task = None
+        # Arm the deadline before sending so it also bounds a send that
+        # never completes; call_later avoids spinning up a task that is
+        # almost always cancelled
         if self.no_response:
             timeout = LutronCommand.get_configuration('command.no_response_timeout', 0.2)
-        
-        async def handle_timeout():
-            try:
-                await asyncio.sleep(timeout)
-                self._logger.info(f"Command {formatted_command} timed out after {timeout}s")
-                if self.no_response:
-                    unsubscribe_all()
-                    future.set_result(None)
-                elif not future.done():
-                    unsubscribe_all()
-                    future.set_exception(CommandTimeout(f"Command {formatted_command} timed out after {timeout}s"))
-            except asyncio.CancelledError:
-                pass
-        
-        # Start timeout monitoring
-        timeout_task = asyncio.create_task(
-            handle_timeout(),
-            name=f"timeout-execute-command"
+
+        loop = asyncio.get_running_loop()
+        timeout_handle = loop.call_later(
+            timeout, self._on_timeout, formatted_command, timeout, future, unsubscribe_all
         )
-        
+
+        # Send as a task and wait on the command future, so a send that
+        # stalls still resolves via the timeout; send failures are
+        # propagated onto the future from the callback
+        def _on_send_done(task: asyncio.Task) -> None:
+            if task.cancelled():
+                return
+            e = task.exception()
+            if e is not None and not future.done():
+                unsubscribe_all()
+                future.set_exception(e)
+
+        send_task = loop.create_task(
+            lutron_client.send_raw(formatted_command, drain=not self.no_response)
+        )
+        send_task.add_done_callback(_on_send_done)
+
         try:
             # Wait for the future to complete
-            result = await future
-            # Cancel the timeout task if it's still running
-            if timeout_task and not timeout_task.done():
-                timeout_task.cancel()
-            return result
+            return await future
         finally:
-            # Ensure timeout task is cancelled
-            if timeout_task and not timeout_task.done():
-                timeout_task.cancel()
+            timeout_handle.cancel()
+            if not send_task.done():
+                send_task.cancel()
+
+    def _on_timeout(self, formatted_command: str, timeout: float,
+                    future: asyncio.Future, unsubscribe_all: Callable[[], None]) -> None:
+        """Deadline callback: resolve no-response commands, fail the rest."""
+        self._logger.info(f"Command {formatted_command} timed out after {timeout}s")
+        if future.done():
+            return
+        unsubscribe_all()
+        if self.no_response:
+            future.set_result(None)
+        else:
+            future.set_exception(CommandTimeout(f"Command {formatted_command} timed out after {timeout}s"))
 
     def _default_execute_hook(self, context: ExecuteContext):
-        response_handler = lambda event_data: self.handle_response(event_data, context.future, context.unsubscribe_all)
-
         if not self.no_response:
-            context.event_tokens.append(context.client.subscribe(self.command_name, response_handler))
\ No newline at end of file
+            handler = _ResponseHandler(self, context.future, context.unsubscribe_all)
+            context.cleanup_fns.append(
+                self._add_pending(context.client, self.command_name, handler))
\ No newline at end of file
@@ -11,6 +11,11 @@ class OutputAction(Enum):
     STOP_RAISE_LOWER = 4          # Set Stop raising/lowering
     PULSE_TIME       = 5          # Set Pulse time
     
+# Accepts raw ints and OutputAction members alike; avoids the enum
+# constructor's try/except on the bulk command-creation path
+_ACTION_LOOKUP: dict[Union[int, OutputAction], OutputAction] = {a.value: a for a in OutputAction}
+_ACTION_LOOKUP.update({a: a for a in OutputAction})
+
 output_command_definitions = [
     Cmd(OutputAction.ZONE_LEVEL, CommandResponseProcessors.to_float),
     Cmd.SET(OutputAction.START_RAISE, CommandResponseProcessors.to_int, no_response=True),
@@ -23,6 +28,8 @@ schema = CommandSchema("OUTPUT,{iid},{action}", output_command_definitions)
 
 class OutputCommand(LutronCommand[OutputAction], schema=schema):
 
+    __slots__ = ('iid',)
+
     def __init__(self, iid: int, action: Union[int, OutputAction]):
         """
         Initialize an output command.
@@ -31,15 +38,8 @@ class OutputCommand(LutronCommand[OutputAction], schema=schema):
             action (Union[int, OutputAction]): Output action to perform. Either a value from 
                 OutputAction or an integer value corresponding to an action.
         """
-        # Convert int to enum if needed
-        if isinstance(action, int):
-            try: 
-                output_action = OutputAction(action)
-            except ValueError:
-                raise ValueError(f"Invalid output action: {action}")
-        elif isinstance(action, OutputAction):
-            output_action = action
-        else:
+        output_action = _ACTION_LOOKUP.get(action)
+        if output_action is None:
             raise ValueError(f"Invalid output action: {action}")
 
         super().__init__(action=output_action)
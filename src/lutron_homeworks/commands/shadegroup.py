@@ -12,6 +12,11 @@ class ShadeGroupAction(Enum):
     STOP_RAISE_LOWER = 4          # Set Stop raising/lowering
     CURRENT_PRESET   = 6          # Set Current preset
     
+# Accepts raw ints and ShadeGroupAction members alike; avoids the enum
+# constructor's try/except on the bulk command-creation path
+_ACTION_LOOKUP: dict[Union[int, ShadeGroupAction], ShadeGroupAction] = {a.value: a for a in ShadeGroupAction}
+_ACTION_LOOKUP.update({a: a for a in ShadeGroupAction})
+
 shade_group_command_definitions = [
     Cmd(ShadeGroupAction.ZONE_LEVEL, CommandResponseProcessors.to_float),
     Cmd.SET(ShadeGroupAction.START_RAISE, CommandResponseProcessors.to_int, no_response=True),
@@ -24,6 +29,8 @@ schema = CommandSchema("SHADEGRP,{iid},{action}", shade_group_command_definition
 
 class ShadeGroupCommand(LutronCommand[ShadeGroupAction], schema=schema):
 
+    __slots__ = ('iid',)
+
     def __init__(self, iid: int, action: Union[int, ShadeGroupAction]):
         """
         Initialize a shade group command.
@@ -33,17 +40,10 @@ class ShadeGroupCommand(LutronCommand[ShadeGroupAction], schema=schema):
                 Either a value from ShadeGroupAction or an integer value 
                 corresponding to an action.
         """
-        # Convert int to enum if needed
-        if isinstance(action, int):
-            try: 
-                shade_group_action = ShadeGroupAction(action)
-            except ValueError:
-                raise ValueError(f"Invalid shade group action: {action}")
-        elif isinstance(action, ShadeGroupAction):
-            shade_group_action = action
-        else:
+        shade_group_action = _ACTION_LOOKUP.get(action)
+        if shade_group_action is None:
             raise ValueError(f"Invalid shade group action: {action}")
-            
+
         super().__init__(action=shade_group_action)
 
         self.iid = iid
@@ -18,6 +18,11 @@ class SystemAction(Enum):
     OS_REV    = 8                 # Get OS revision
     LOAD_SHED = 11                # Set load shed
 
+# Accepts raw ints and SystemAction members alike; avoids the enum
+# constructor's try/except on the bulk command-creation path
+_ACTION_LOOKUP: dict[Union[int, SystemAction], SystemAction] = {a.value: a for a in SystemAction}
+_ACTION_LOOKUP.update({a: a for a in SystemAction})
+
 system_command_definitions = [
     Cmd(SystemAction.TIME, CommandResponseProcessors.to_time),
     Cmd(SystemAction.DATE, CommandResponseProcessors.to_date),
@@ -35,7 +40,9 @@ class SystemCommand(LutronCommand[SystemAction], schema=schema):
     """
     Command for Lutron Homeworks system-level operations.
     """
-    
+
+    __slots__ = ()
+
     def __init__(self, action: Union[int, SystemAction]):
         """
         Initialize a system command.
@@ -45,29 +52,17 @@ class SystemCommand(LutronCommand[SystemAction], schema=schema):
                 Either a value from SystemAction or an integer value 
                 corresponding to an action.
         """
-        # Convert int to enum if needed
-        if isinstance(action, int):
-            try: 
-                system_action = SystemAction(action)
-            except ValueError:
-                raise ValueError(f"Invalid system action: {action}")
-        elif isinstance(action, SystemAction):
-            system_action = action
-        else:
+        system_action = _ACTION_LOOKUP.get(action)
+        if system_action is None:
             raise ValueError(f"Invalid system action: {action}")
-            
-        super().__init__(action=system_action)
 
-        if self.action == SystemAction.OS_REV:
-            self.custom_event = LutronSpecialEvents.NonResponseEvents.value
-            self.custom_handler = self._line_handler
-                
+
         super().__init__(action=system_action)
 
         if self.action == SystemAction.OS_REV:
             self.custom_event = LutronSpecialEvents.NonResponseEvents.value
             self.custom_handler = self._line_handler
-    
+
     # Factory methods for common operations
     @classmethod
     def get_time(cls) -> 'SystemCommand':
@@ -1,9 +1,17 @@
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable
+import functools
 import hashlib
+import io
 import logging
-from xml.etree import ElementTree as ET
+import sys
+# Prefer lxml's libxml2-backed parser when available; the streaming
+# iterparse surface used below is identical in the stdlib fallback
+try:
+    from lxml import etree as ET  # type: ignore[import-not-found]
+except ImportError:
+    from xml.etree import ElementTree as ET  # type: ignore[no-redef]
 
 from .loader import LutronXMLDataLoader
 from .filters import FilterLibrary, Filter
@@ -20,9 +28,23 @@ logger = logging.getLogger(__name__)
 class LutronDatabase:
     def __init__(self, loader: LutronXMLDataLoader):
         self._entities: dict[str, LutronDBEntity] = {}
+        # Secondary indexes so by-IID lookups avoid scanning every entity.
+        # First entity wins for a given iid, matching the old scan order.
+        self._outputs_by_iid: dict[int, LutronDBEntity] = {}
+        self._areas_by_iid: dict[int, LutronDBEntity] = {}
         self._filters: list[Filter] = []
+        # Filter chain collapsed into one callable; rebuilt by enable_filter
+        self._fused_filter: Callable[[LutronDBEntity], LutronDBEntity] | None = None
         self.loader = loader
 
+        # Bumped whenever the entity set changes; materialized views below
+        # are valid only for the epoch they were built in
+        self._epoch = 0
+        self._outputs_cache: tuple[int, list[LutronOutput]] | None = None
+        self._areas_cache: tuple[int, list[LutronArea]] | None = None
+        self._outputs_by_type_cache: tuple[int, dict[str, list[LutronOutput]]] | None = None
+        self._path_cache: tuple[int, dict[str, list[str]]] | None = None
+
         self._type_map: dict[str, list[str]] | None = None
         self._subtype_to_custom_type_map: dict[str, str] | None = None
 
@@ -42,6 +64,22 @@ class LutronDatabase:
             return
         
         self._filters.append(filter)
+        self._fused_filter = self._compose_filters(self._filters)
+        self._epoch += 1
+
+    @staticmethod
+    def _compose_filters(filters: list[Filter]) -> Callable[[LutronDBEntity], LutronDBEntity] | None:
+        if not filters:
+            return None
+        if len(filters) == 1:
+            return filters[0]
+
+        chain = tuple(filters)
+        def fused(entity: LutronDBEntity) -> LutronDBEntity:
+            for f in chain:
+                entity = f(entity)
+            return entity
+        return fused
 
     def apply_custom_type_map(self, type_map: dict[str, list[str]]):
         """
@@ -53,8 +91,8 @@ class LutronDatabase:
         self._type_map = type_map
 
         self._subtype_to_custom_type_map = {
-            subtype: custom_type 
-            for custom_type, subtypes in type_map.items() 
+            subtype: sys.intern(custom_type)
+            for custom_type, subtypes in type_map.items()
             for subtype in subtypes
         }
 
@@ -69,22 +107,41 @@ class LutronDatabase:
                 # Other entities are not affected by custom type map
                 entities[db_id] = entity
         self._entities = entities
+        self._rebuild_indexes()
+        self._epoch += 1
+
+    def _index_entity(self, entity: LutronDBEntity):
+        if entity.iid is None:
+            return
+        if entity.type == EntityType.OUTPUT:
+            self._outputs_by_iid.setdefault(entity.iid, entity)
+        elif entity.type == EntityType.AREA:
+            self._areas_by_iid.setdefault(entity.iid, entity)
+
+    def _rebuild_indexes(self):
+        self._outputs_by_iid = {}
+        self._areas_by_iid = {}
+        for entity in self._entities.values():
+            self._index_entity(entity)
 
     def _apply_filters(self, entity: LutronDBEntity) -> LutronDBEntity:
-        for filter in self._filters:
-            entity = filter(entity)
-        return entity
+        fused = self._fused_filter
+        return entity if fused is None else fused(entity)
     
-    def _hash_str(self, s: str) -> str:
-        # Fold bytes into 64 bytes
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _hash_str(s: str) -> str:
+        # Fold the 32-byte digest down to 8 by xoring the four 8-byte lanes
+        # as integers; same output as the old byte-by-byte loop without the
+        # per-byte interpreter iterations
         digest = hashlib.sha256(s.encode('utf-8')).digest()
-        # xor bytes 0-7 with bytes 8-15 and bytes 16-23 and bytes 24-31
-        folded = b''
-        for i in range(8):
-            folded += bytes([digest[i] ^ digest[i + 8] ^ digest[i + 16] ^ digest[i + 24]])
-        
-        # Return as hex
-        return folded.hex()
+        folded = (
+            int.from_bytes(digest[0:8], 'little')
+            ^ int.from_bytes(digest[8:16], 'little')
+            ^ int.from_bytes(digest[16:24], 'little')
+            ^ int.from_bytes(digest[24:32], 'little')
+        )
+        return folded.to_bytes(8, 'little').hex()
 
     def _generate_area_id(self, area_element: ET.Element, parent_key: str, sibling_index: int) -> str:
         iid = area_element.get('IntegrationID')
@@ -100,65 +157,103 @@ class LutronDatabase:
         key = f"{area_key}/output[{sibling_index}]"
         return f"DBO:{self._hash_str(key)}"
     
-    def _walk_tree(self, element: ET.Element, parent_key: str = ""):
-        area_elements = element.findall("Area")
-        for i, area in enumerate(area_elements):
-            area_id = self._generate_area_id(area, parent_key, i)
-            area_data = {
-                "db_id": area_id,
-                "iid": area.get("IntegrationID"),
-                "name": area.get("Name"),
-                "type": EntityType.AREA,
-                "sort_order": area.get("SortOrder"),
-                "parent_db_id": parent_key or None,
-            }
-            entity = LutronDBEntity.from_dict(area_data)
-            entity = self._apply_filters(entity)
-            self._entities[entity.db_id] = entity
-            entity.with_path(self.getPath(entity.db_id))
-
-
-            outputs = area.find("Outputs")
-            if outputs is not None:
-                for j, output in enumerate(outputs.findall("Output")):
-                    output_id = self._generate_output_id(output, area_id, j)
-                    
-                    output_data = {
-                        "db_id": output_id,
-                        "iid": output.get("IntegrationID"),
-                        "name": output.get("Name"),
-                        "type": EntityType.OUTPUT,
-                        "subtype": output.get("OutputType"),
-                        "sort_order": output.get("SortOrder"),
-                        "parent_db_id": area_id,
-                    }
-                    entity = LutronDBEntity.from_dict(output_data)
-                    entity = self._apply_filters(entity)
-
-                    if self._subtype_to_custom_type_map is not None:
-                        if entity.subtype in self._subtype_to_custom_type_map:
-                            entity.subtype = self._subtype_to_custom_type_map[entity.subtype]
-                        else:
-                            # Drop outputs that don't match the custom type map
-                            continue
-                    
-                    self._entities[entity.db_id] = entity
-                    entity.with_path(self.getPath(entity.db_id))
-
-            nested = area.find("Areas")
-            if nested is not None:
-                self._walk_tree(nested, area_id)
-    
+    def _add_area(self, area: ET.Element, parent_key: str, sibling_index: int) -> str:
+        area_id = self._generate_area_id(area, parent_key, sibling_index)
+        area_data = {
+            "db_id": area_id,
+            "iid": area.get("IntegrationID"),
+            "name": area.get("Name"),
+            "type": EntityType.AREA,
+            "sort_order": area.get("SortOrder"),
+            "parent_db_id": parent_key or None,
+        }
+        entity = LutronDBEntity.from_dict(area_data)
+        entity = self._apply_filters(entity)
+        self._entities[entity.db_id] = entity
+        self._index_entity(entity)
+        entity.with_path(self.getPath(entity.db_id))
+        return area_id
+
+    def _add_output(self, output: ET.Element, area_key: str, sibling_index: int):
+        output_id = self._generate_output_id(output, area_key, sibling_index)
+        # Subtype strings repeat across most outputs; interning collapses
+        # the duplicates and makes subtype equality a pointer compare
+        subtype = output.get("OutputType")
+        output_data = {
+            "db_id": output_id,
+            "iid": output.get("IntegrationID"),
+            "name": output.get("Name"),
+            "type": EntityType.OUTPUT,
+            "subtype": sys.intern(subtype) if isinstance(subtype, str) else subtype,
+            "sort_order": output.get("SortOrder"),
+            "parent_db_id": area_key,
+        }
+        entity = LutronDBEntity.from_dict(output_data)
+        entity = self._apply_filters(entity)
+
+        if self._subtype_to_custom_type_map is not None:
+            if entity.subtype in self._subtype_to_custom_type_map:
+                entity.subtype = self._subtype_to_custom_type_map[entity.subtype]
+            else:
+                # Drop outputs that don't match the custom type map
+                return
+
+        self._entities[entity.db_id] = entity
+        self._index_entity(entity)
+        entity.with_path(self.getPath(entity.db_id))
+
     def _parse_xml(self, xml: bytes):
         logger.info("Processing XML data and updating database...")
-        root = ET.fromstring(xml.decode('utf-8'))
+        self._epoch += 1
+
+        # Stream the document instead of materializing the full DOM.
+        # Attributes are available on 'start' events, so areas and outputs
+        # are emitted in document order (parents before children, which
+        # getPath relies on) and each element is cleared on 'end' to keep
+        # peak memory proportional to tree depth rather than file size.
+        #
+        # Stack frames mirror the open elements. An Areas frame carries the
+        # parent key its Area children should attach to; an Area frame
+        # carries its own db_id once processed. Frames for elements outside
+        # the Project/Areas chain stay inert.
+        found_areas = False
+        stack: list[dict[str, Any]] = []
+
+        for event, element in ET.iterparse(io.BytesIO(xml), events=('start', 'end')):
+            if event == 'start':
+                parent = stack[-1] if stack else None
+                frame: dict[str, Any] = {'tag': element.tag}
+                tag = element.tag
+
+                if tag == 'Areas':
+                    if parent is not None and len(stack) == 1:
+                        # Top-level Areas container under the document root
+                        frame['container_key'] = ""
+                        frame['area_count'] = 0
+                        found_areas = True
+                    elif parent is not None and 'area_id' in parent:
+                        # Nested container under a processed area
+                        frame['container_key'] = parent['area_id']
+                        frame['area_count'] = 0
+                elif tag == 'Area' and parent is not None and 'container_key' in parent:
+                    index = parent['area_count']
+                    parent['area_count'] = index + 1
+                    frame['area_id'] = self._add_area(element, parent['container_key'], index)
+                elif tag == 'Outputs' and parent is not None and 'area_id' in parent:
+                    frame['outputs_for'] = parent['area_id']
+                    frame['output_count'] = 0
+                elif tag == 'Output' and parent is not None and 'outputs_for' in parent:
+                    index = parent['output_count']
+                    parent['output_count'] = index + 1
+                    self._add_output(element, parent['outputs_for'], index)
 
-        areas_element = root.find("Areas")
-        if areas_element is None:
+                stack.append(frame)
+            else:
+                stack.pop()
+                element.clear()
+
+        if not found_areas:
             logger.error("Failed to find Areas element in XML data")
-            return
-        
-        self._walk_tree(areas_element)
 
     def getEntity(self, db_id: str) -> LutronEntity:
         return self._entities[db_id]
@@ -167,52 +262,71 @@ class LutronDatabase:
         return list(self._entities.values())
     
     def getPath(self, db_id: str) -> list[str]:
+        cache = self._path_cache
+        if cache is None or cache[0] != self._epoch:
+            cache = self._path_cache = (self._epoch, {})
+        paths = cache[1]
+
+        cached = paths.get(db_id)
+        if cached is not None:
+            return cached
+
         entity = self._entities[db_id]
         path = []
         while entity:
-            path.insert(0, entity.name)
+            # append + reverse instead of insert(0, ...), which is O(n)
+            # per step and makes deep trees quadratic
+            path.append(entity.name)
             if entity.parent_db_id is None:
                 break
             entity = self._entities.get(entity.parent_db_id)
+        path.reverse()
+
+        paths[db_id] = path
         return path
     
     def getOutputs(self) -> list[LutronOutput]:
-        return [
+        cache = self._outputs_cache
+        if cache is not None and cache[0] == self._epoch:
+            return cache[1]
+
+        outputs = [
             LutronOutput.from_entity(entity)
-            for entity in self._entities.values() 
+            for entity in self._entities.values()
             if entity.type == EntityType.OUTPUT
         ]
+        self._outputs_cache = (self._epoch, outputs)
+        return outputs
 
     def getOutputsByIID(self, iid: int) -> LutronOutput | None:
-        output = next( (
-            entity
-            for entity in self._entities.values()
-            if entity.type == EntityType.OUTPUT and entity.iid == iid
-        ), None)
-        
+        output = self._outputs_by_iid.get(iid)
         return LutronOutput.from_entity(output) if output else None
 
     def getOutputsByType(self, output_type: str) -> list[LutronOutput]:
-        return [
-            LutronOutput.from_entity(entity)
-            for entity in self._entities.values() 
-            if entity.type == EntityType.OUTPUT and entity.subtype == output_type
-        ]
+        cache = self._outputs_by_type_cache
+        if cache is None or cache[0] != self._epoch:
+            by_type: dict[str, list[LutronOutput]] = {}
+            for entity in self._entities.values():
+                if entity.type == EntityType.OUTPUT:
+                    by_type.setdefault(entity.subtype, []).append(LutronOutput.from_entity(entity))
+            cache = self._outputs_by_type_cache = (self._epoch, by_type)
+        return cache[1].get(output_type, [])
 
     def getAreas(self, parents: bool = False) -> list[LutronArea]:
-        return [
+        cache = self._areas_cache
+        if cache is not None and cache[0] == self._epoch:
+            return cache[1]
+
+        areas = [
             LutronArea.from_entity(entity)
-            for entity in self._entities.values() 
+            for entity in self._entities.values()
             if entity.type == EntityType.AREA
         ]
+        self._areas_cache = (self._epoch, areas)
+        return areas
 
     def getAreasById(self, area_id: int) -> LutronArea | None:
-        area = next( (
-            entity
-            for entity in self._entities.values()
-            if entity.type == EntityType.AREA and entity.iid == area_id
-        ), None)
-        
+        area = self._areas_by_iid.get(area_id)
         return LutronArea.from_entity(area) if area else None
 
     def getShadeGroups(self) -> list[LutronEntity]:
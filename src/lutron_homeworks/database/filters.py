@@ -1,7 +1,12 @@
 import re
+import sys
 from typing import Any
 from .types import LutronDBEntity
 
+# Compiled once; per-call re.sub pays a cache lookup plus dispatch for the
+# same constant pattern on every entity
+_NUMBER_RE = re.compile(r'\d+')
+
 class Filter:
     def __init_subclass__(cls, filter_name: str, **kwargs):
         cls.filter_name = filter_name
@@ -63,13 +68,13 @@ class PreserveNumberFilter(Filter, filter_name='preserve_number'):
     @classmethod
     def number_replacer(cls, match: re.Match) -> str:
         number = match.group(0)
-        return cls.known_numbers[number] if number in cls.known_numbers else number
-    
+        return cls.known_numbers.get(number, number)
+
     def __call__(self, entity: LutronDBEntity) -> LutronDBEntity:
         assert isinstance(entity.name, str)
         if self.name_match in entity.name:
             # Find the number in the name and replace with lookup table
-            entity.name = re.sub(r'\d+', self.number_replacer, entity.name)
+            entity.name = _NUMBER_RE.sub(self.number_replacer, entity.name)
         return entity
 
 
@@ -81,15 +86,15 @@ class SubtypeFixFilter(Filter, filter_name='subtype_fix'):
         self.match_key = match_key
         self.match_value = match_value
         self.new_subtype = new_subtype
-    
-    def __call__(self, entity: LutronDBEntity) -> LutronDBEntity:
-        def matches(entity: LutronDBEntity) -> bool:
-            target = getattr(entity, self.match_key)
-            if isinstance(self.match_value, str):
-                return self.match_value in target
-            return self.match_value == target
+        # Bind the matcher once; the old inner closure allocated a function
+        # object and re-checked the match_value type on every entity
+        if isinstance(match_value, str):
+            self._matcher = lambda target: match_value in target
+        else:
+            self._matcher = lambda target: match_value == target
 
-        if matches(entity):
+    def __call__(self, entity: LutronDBEntity) -> LutronDBEntity:
+        if self._matcher(getattr(entity, self.match_key)):
             entity.subtype = self.new_subtype
         return entity
 
@@ -98,7 +103,8 @@ class TypeSuffixFilter(Filter, filter_name='type_suffix'):
     Append "Shade" as a suffix to SYSTEM_SHADE outputs.
     """
     def __init__(self, output_type: str, suffix: str):
-        self.output_type = output_type
+        # Interned to match the database's interned subtype strings
+        self.output_type = sys.intern(output_type)
         self.suffix = suffix
     
     def __call__(self, entity: LutronDBEntity) -> LutronDBEntity:
@@ -120,7 +126,12 @@ class StripNumericPrefixFilter(Filter, filter_name='strip_numeric_prefix'):
     
     def __call__(self, entity: LutronDBEntity) -> LutronDBEntity:
         if self.name_match is None or self.name_match in entity.name:
-            entity.name = re.sub(r'^\d+ *', '', entity.name)
+            # C-level strip instead of the regex engine; only trim spaces
+            # when digits were actually removed, matching r'^\d+ *'
+            name = entity.name
+            stripped = name.lstrip('0123456789')
+            if stripped != name:
+                entity.name = stripped.lstrip(' ')
         return entity
 
 class StripNumericSuffixFilter(Filter, filter_name='strip_numeric_suffix'):
@@ -136,6 +147,11 @@ class StripNumericSuffixFilter(Filter, filter_name='strip_numeric_suffix'):
     
     def __call__(self, entity: LutronDBEntity) -> LutronDBEntity:
         if self.name_match is None or self.name_match in entity.name:
-            entity.name = re.sub(r' *\d+$', '', entity.name)
+            # C-level strip instead of the regex engine; only trim spaces
+            # when digits were actually removed, matching r' *\d+$'
+            name = entity.name
+            stripped = name.rstrip('0123456789')
+            if stripped != name:
+                entity.name = stripped.rstrip(' ')
         return entity
     
\ No newline at end of file
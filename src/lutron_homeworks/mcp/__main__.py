@@ -7,6 +7,7 @@ from lutron_homeworks.mcp.server import version
   
 from lutron_homeworks.mcp.server import run_server
 from lutron_homeworks.utils.logging import LevelColorFormatter
+from lutron_homeworks.utils.loop import install_uvloop
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,8 @@ def main():
     else:
         root_logger.setLevel(logging.WARNING)
     
+    install_uvloop()
+
     try:
         asyncio.run(run_server(args))
     except KeyboardInterrupt:
@@ -1,5 +1,5 @@
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Callable, List, TypeVar, Union, TYPE_CHECKING
 
@@ -32,6 +32,9 @@ class ExecuteContext:
     event_tokens: List[SubscriptionToken]
     future: asyncio.Future
     unsubscribe_all: UnsubscribeFnT
+    # Removal callbacks for shared-dispatcher registrations; invoked by
+    # unsubscribe_all alongside the token unsubscribes
+    cleanup_fns: List[Callable[[], None]] = field(default_factory=list)
 
 # Custom handler type for command response processing
 CustomHandlerT = Callable[[bytes | List[Any] | None, asyncio.Future, UnsubscribeFnT], None]
@@ -45,8 +45,10 @@ class EventBus:
     """
 
     def __init__(self):
-        # For each event label, store a list of SubscriberEntry
-        self._subscribers: Dict[EventT, List[SubscriberEntry]] = {}
+        # For each event label, store an immutable tuple of SubscriberEntry.
+        # Subscribe/unsubscribe rebuild the tuple (copy-on-write) so emit can
+        # iterate the stored snapshot directly with no defensive copy.
+        self._subscribers: Dict[EventT, tuple[SubscriberEntry, ...]] = {}
         # Single global monotonically increasing nonce
         self._nonce: int = 0
         self._loop = asyncio.get_event_loop()
@@ -56,7 +58,7 @@ class EventBus:
         Emit an event by name. Triggers all subscribers to that event name and any matching regex pattern.
         """
         # Call string subscribers
-        for entry in list(self._subscribers.get(event, [])):
+        for entry in self._subscribers.get(event, ()):
             self._loop.create_task(
                 self._emit_callback(entry.callback, data),
                 name=f"EventBus-callback"
@@ -99,7 +101,7 @@ class EventBus:
         self._nonce += 1
 
         entry = SubscriberEntry(callback=callback, token=token)
-        self._subscribers.setdefault(event, []).append(entry)
+        self._subscribers[event] = self._subscribers.get(event, ()) + (entry,)
 
         return token
 
@@ -130,10 +132,12 @@ class EventBus:
         
         for i, entry in enumerate(subscribers):
             if entry.token == token:
-                del subscribers[i]
-                if not subscribers:
+                remaining = subscribers[:i] + subscribers[i + 1:]
+                if remaining:
+                    self._subscribers[event] = remaining
+                else:
                     del self._subscribers[event]
                 return True
-        
+
         return False
 
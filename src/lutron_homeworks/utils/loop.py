@@ -0,0 +1,17 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+def install_uvloop() -> bool:
+    """Install uvloop as the event loop policy when available.
+
+    Returns True if uvloop was installed, False if it is not importable.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    uvloop.install()
+    logger.debug("uvloop event loop policy installed")
+    return True